@@ -13,62 +13,590 @@ Description:
     automatic benchmarking, and real-time progress tracking.
 
 Architecture:
-    - Multi-threaded parallel processing with configurable strategies
+    - Asynchronous (asyncio + httpx, HTTP/2) strategy by default, with
+      per-TLD limits and optional multiprocessing across TLDs
+    - Multi-threaded fallback strategy on per-thread urllib3 pools
     - RDAP-based domain verification (modern WHOIS replacement)
-    - Intelligent batching for optimal network utilization
     - Memory-efficient streaming processing
+    - On-disk RDAP result cache with TTL to skip repeat queries across runs
     - Comprehensive error handling and graceful shutdown
 
 Performance:
     - Supports 3-letter (17,576) and 4-letter (456,976) combinations
-    - Processes 100-200 domains/second depending on strategy
-    - Automatic benchmarking selects optimal configuration
-    - Connection pooling and timeout management
+    - Throughput is bound by registry latency and PER_TLD_CONCURRENCY
+      in-flight requests per TLD, not by local threads
+    - Concurrency sized from measured latency, or by a benchmark sweep
+    - Keep-alive connection pools and 1s connect / 1s read timeouts
 """
 
+import argparse
+import asyncio
+import email.utils
 import multiprocessing
 import string
-import requests
+import httpx
+import itertools
+import json
+import urllib3
+from urllib.parse import urljoin
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import math
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import os
+import queue
+import random
 import sys
 import signal
+import socket
+import sqlite3
+import statistics
+import threading
 
-def check_domain_batch(domains_batch):
+try:
+    # Optional: libuv-based event loop with lower per-syscall overhead
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    # Optional: asynchronous DNS used as a cheap prefilter before RDAP
+    import aiodns
+except ImportError:
+    aiodns = None
+
+# RDAP bootstrap endpoint; the domain name is appended to this prefix.
+# Used for TLDs missing from the IANA registry or if it cannot be fetched.
+RDAP_URL = "https://rdap.org/domain/"
+
+# IANA registry mapping each TLD to its authoritative RDAP server
+IANA_BOOTSTRAP_URL = "https://data.iana.org/rdap/dns.json"
+
+# Headers sent with every RDAP query, shared by the sync and async clients
+RDAP_HEADERS = {
+    "Accept": "application/rdap+json",
+    "Connection": "keep-alive",
+}
+
+# In-flight requests for check_domains_async when no concurrency is given.
+# A run never has more than PER_TLD_CONCURRENCY per TLD in flight; the
+# menu lowers this default to concurrency_cap for the selected TLDs.
+DEFAULT_CONCURRENCY = 500
+
+# Attempts for rate-limited (429) or failing (5xx) answers before giving up
+MAX_ATTEMPTS = 3
+
+# Longest Retry-After a worker honours before backing off; larger values
+# are clamped so one registry cannot park a worker for minutes
+MAX_RETRY_AFTER = 30
+
+# Simultaneous requests allowed against a single TLD's registry
+PER_TLD_CONCURRENCY = 100
+
+# Keep-alive connections per host in each worker thread's PoolManager. A
+# thread runs one request at a time, so a small pool is enough.
+THREAD_POOL_SIZE = 4
+
+# Registry hosts whose connection pools a PoolManager keeps open at once
+POOL_HOSTS = 64
+
+# Seconds a resolved registry address is reused before asking the resolver again
+DNS_CACHE_TTL = 3600
+
+_system_getaddrinfo = socket.getaddrinfo
+
+# (host, port, family, type, proto, flags) -> (expiry, addrinfo list)
+_dns_cache = {}
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """
+    socket.getaddrinfo replacement that memoizes answers for DNS_CACHE_TTL.
+    
+    Args:
+        host, port, family, type, proto, flags: As for socket.getaddrinfo
+        
+    Returns:
+        list: Address tuples from the system resolver, possibly cached
+    """
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+    entry = _dns_cache.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    
+    # Failures propagate without being cached so the next call retries
+    addresses = _system_getaddrinfo(host, port, family, type, proto, flags)
+    _dns_cache[key] = (now + DNS_CACHE_TTL, addresses)
+    return addresses
+
+def enable_dns_cache():
+    """
+    Route every getaddrinfo call in the process through the DNS cache.
+    
+    Note:
+        All RDAP traffic goes to a handful of registry hosts, yet each new
+        pooled connection (per worker thread, per host) and every httpx
+        connection resolves the name again. With hundreds of workers that
+        floods the local resolver with identical queries. urllib3 resolves
+        through socket.getaddrinfo, and so does httpx on the standard
+        asyncio loop, whose getaddrinfo calls it in the default executor.
+        Under uvloop, httpx resolves through libuv's own getaddrinfo and
+        bypasses this cache; libuv still runs the lookup off the loop, but
+        every new connection queries the resolver again. The aiodns
+        prefilter queries NS records directly and is unaffected.
+    """
+    socket.getaddrinfo = _cached_getaddrinfo
+
+# Redirects (rdap.org -> registry) are followed, nothing is retried, so a
+# failing domain never blocks a worker longer than its timeout
+NO_RETRIES = urllib3.Retry(total=None, connect=0, read=0, status=0, other=0, redirect=5)
+
+def create_pool_manager(pool_size=THREAD_POOL_SIZE):
+    """
+    Build a urllib3 PoolManager with keep-alive connection pools for RDAP.
+    
+    Args:
+        pool_size (int): Maximum connections kept open per host
+        
+    Returns:
+        urllib3.PoolManager: One connection pool per registry host
+        
+    Note:
+        Reusing pooled connections avoids a DNS lookup plus TCP and TLS
+        handshake on every query. urllib3 is used directly rather than
+        through requests: a requests Session builds a PreparedRequest,
+        merges cookies and proxy environment settings and runs hooks on
+        every call, which is pure overhead for a bare HEAD.
+    """
+    return urllib3.PoolManager(num_pools=POOL_HOSTS, maxsize=pool_size,
+                               headers=RDAP_HEADERS, retries=NO_RETRIES)
+
+# One PoolManager per thread: urllib3 guards each pool with a lock, which a
+# single manager shared by 100+ workers turns into a contention point
+_thread_local = threading.local()
+
+def get_pool_manager():
+    """
+    Return the calling thread's PoolManager, creating it on first use.
+    
+    Returns:
+        urllib3.PoolManager: Manager owned by the current thread
+    """
+    manager = getattr(_thread_local, "manager", None)
+    if manager is None:
+        manager = _thread_local.manager = create_pool_manager()
+        _thread_local.registry_pools = {}
+    return manager
+
+def get_registry_pool(base_url):
+    """
+    Return the calling thread's connection pool for an RDAP base URL.
+    
+    Args:
+        base_url (str): RDAP base URL, ending in '/'
+        
+    Returns:
+        tuple: (urllib3 connection pool, URL path prefix for queries)
+        
+    Note:
+        The pool and path are looked up once per registry and thread, so
+        the per-domain request skips URL parsing and the PoolManager's
+        pool-key computation entirely.
+    """
+    manager = get_pool_manager()
+    entry = _thread_local.registry_pools.get(base_url)
+    if entry is None:
+        pool = manager.connection_from_url(base_url)
+        entry = (pool, urllib3.util.parse_url(base_url).path)
+        _thread_local.registry_pools[base_url] = entry
+    return entry
+
+# TLD (without dot) -> authoritative RDAP base URL, filled by main()
+_rdap_servers = {}
+
+def load_rdap_bootstrap(timeout=10):
+    """
+    Download the IANA RDAP bootstrap registry for DNS.
+    
+    Args:
+        timeout (float): Request timeout in seconds
+        
+    Returns:
+        dict: TLD (lowercase, without dot) -> base URL ending in '/'.
+        Empty if the registry could not be fetched.
+        
+    Note:
+        Querying the authoritative server directly skips the extra
+        redirect round-trip through rdap.org on every domain, and spreads
+        the load across registries instead of a single chokepoint. The
+        PoolManager keeps one connection pool per host, so keep-alive
+        still applies to each registry.
+    """
+    try:
+        response = get_pool_manager().request("GET", IANA_BOOTSTRAP_URL, timeout=timeout,
+                                              headers={"Accept": "application/json"})
+        if response.status != 200:
+            raise urllib3.exceptions.HTTPError(f"HTTP {response.status}")
+        services = json.loads(response.data)["services"]
+    except Exception:
+        print("⚠️ No se pudo descargar el registro RDAP de IANA, usando rdap.org")
+        return {}
+    
+    servers = {}
+    for tlds, urls in services:
+        # Prefer HTTPS endpoints when a registry lists several
+        base_url = next((url for url in urls if url.startswith("https://")), urls[0])
+        if not base_url.endswith("/"):
+            base_url += "/"
+        for tld in tlds:
+            servers[tld.lower()] = base_url
+    
+    return servers
+
+def rdap_url(domain):
+    """
+    Build the RDAP query URL for a domain.
+    
+    Args:
+        domain (str): Full domain name (e.g., 'abc.com')
+        
+    Returns:
+        str: Authoritative server URL, or the rdap.org URL as fallback
+    """
+    base_url = _rdap_servers.get(domain.rsplit(".", 1)[-1])
+    if base_url is None:
+        return f"{RDAP_URL}{domain}"
+    return f"{base_url}domain/{domain}"
+
+# Persistent cache of RDAP answers, reused across runs
+CACHE_FILE = "rdap_cache.sqlite"
+
+# Registration state changes slowly; an available domain is re-checked
+# sooner because it is the result the user acts on
+CACHE_TTL_AVAILABLE = 24 * 3600
+CACHE_TTL_REGISTERED = 7 * 24 * 3600
+
+# Outcome of a domain check. Only definitive answers are cached; unknown
+# ones (errors, timeouts, 429, 5xx) are retried and never recorded as taken.
+AVAILABLE = "available"
+REGISTERED = "registered"
+UNKNOWN = "unknown"
+
+# Per-request timeout for the main pass, as (connect, read) seconds. It is
+# kept short to cut the slow tail: anything slower becomes UNKNOWN and is
+# reissued in the retry pass, which gets the generous RETRY_TIMEOUT.
+# Connecting includes the TLS handshake, which to a distant registry can
+# take a few round trips, so it gets the same budget as the read.
+REQUEST_TIMEOUT = (1.0, 1.0)
+RETRY_TIMEOUT = 8
+
+def as_httpx_timeout(timeout):
+    """
+    Convert a (connect, read) timeout for use with httpx.
+    
+    Args:
+        timeout (float or tuple): Seconds, or a (connect, read) pair
+        
+    Returns:
+        httpx.Timeout: Equivalent httpx timeout
+    """
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+class RDAPCache:
+    """
+    SQLite-backed cache of RDAP results keyed by the full domain name.
+    
+    Attributes:
+        ttl_available (int): Seconds an 'available' result stays valid
+        ttl_registered (int): Seconds a 'registered' result stays valid
+        hits (int): Lookups answered from the cache so far
+        
+    Note:
+        All reads and writes happen on the thread that consumes worker
+        results, so a single connection is enough and no locking is needed.
+        Writes are committed every commit_every stores (COMMIT_EVERY by
+        default) so an interrupted run keeps most of its progress. The
+        database runs in WAL mode with synchronous=NORMAL, so those
+        periodic commits append to the log instead of forcing an fsync of
+        the whole B-tree each time.
+    """
+    
+    COMMIT_EVERY = 1000
+    
+    def __init__(self, path=CACHE_FILE, ttl_available=CACHE_TTL_AVAILABLE,
+                 ttl_registered=CACHE_TTL_REGISTERED, commit_every=COMMIT_EVERY):
+        self.ttl_available = ttl_available
+        self.ttl_registered = ttl_registered
+        self.commit_every = commit_every
+        self.hits = 0
+        self._pending_writes = 0
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rdap ("
+            "domain TEXT PRIMARY KEY, available INTEGER NOT NULL, checked_at REAL NOT NULL)"
+        )
+    
+    def lookup(self, domain):
+        """
+        Return the cached availability of a domain.
+        
+        Args:
+            domain (str): Full domain name
+            
+        Returns:
+            bool or None: Cached availability, None if missing or expired
+        """
+        row = self._conn.execute(
+            "SELECT available, checked_at FROM rdap WHERE domain = ?", (domain,)
+        ).fetchone()
+        if row is None:
+            return None
+        
+        available, checked_at = bool(row[0]), row[1]
+        ttl = self.ttl_available if available else self.ttl_registered
+        if time.time() - checked_at > ttl:
+            return None
+        self.hits += 1
+        return available
+    
+    def store(self, domain, state):
+        """
+        Record a check outcome if it is a definitive answer.
+        
+        Args:
+            domain (str): Full domain name
+            state (str): AVAILABLE, REGISTERED or UNKNOWN (not stored)
+        """
+        if state == UNKNOWN:
+            return
+        
+        self._conn.execute(
+            "INSERT OR REPLACE INTO rdap (domain, available, checked_at) VALUES (?, ?, ?)",
+            (domain, int(state == AVAILABLE), time.time())
+        )
+        self._pending_writes += 1
+        if self._pending_writes >= self.commit_every:
+            self.commit()
+    
+    def commit(self):
+        """Flush pending writes to disk."""
+        self._conn.commit()
+        self._pending_writes = 0
+    
+    def close(self):
+        """Commit pending writes and close the database."""
+        self.commit()
+        self._conn.close()
+
+def apply_cache(domains, cache, results):
+    """
+    Lazily skip domains that already have a valid cached answer.
+    
+    Args:
+        domains (iterable): Domain strings to check
+        cache (RDAPCache or None): Result cache, None disables caching
+        results (RunResults): Receives the cached answers as completed domains
+        
+    Yields:
+        str: Domains that still need an RDAP query
+    """
+    if cache is None:
+        yield from domains
+        return
+    
+    for domain in domains:
+        available = cache.lookup(domain)
+        if available is None:
+            yield domain
+        else:
+            results.record(domain, AVAILABLE if available else REGISTERED, cached=True)
+    
+    # Sharded workers leave the console to the parent, which adds up the
+    # hits sent by RunResults.close
+    if cache.hits and results.verbose:
+        print(f"📦 Caché: {cache.hits:,} dominios ya verificados")
+
+# RDAP base URLs that answered HEAD with 405; they go straight to a
+# GET instead of paying a rejected HEAD round trip every time
+_head_rejected = set()
+
+def query_rdap(domain, timeout=REQUEST_TIMEOUT):
+    """
+    Fetch only the RDAP status code for a domain.
+    
+    Args:
+        domain (str): Domain to query
+        timeout (float or tuple): Per-request timeout, or (connect, read)
+        
+    Returns:
+        tuple: (status, retry_after) of the final (post-redirect) response,
+        retry_after being its raw Retry-After header or None
+        
+    Note:
+        Only the status code matters, so a HEAD request is sent and the
+        multi-KB RDAP JSON body is never transferred. Servers that reject
+        HEAD (405) get a GET whose few-KB body is drained so the connection
+        stays reusable. Redirects are followed because the rdap.org fallback answers
+        with a 302 to the authoritative registry. A server that rejects HEAD
+        once is remembered in _head_rejected and only gets GETs afterwards.
+        The request goes straight to the registry's urllib3 pool with a
+        precomputed path; only redirects go through the PoolManager.
+    """
+    url = rdap_url(domain)
+    base_url = url[:-len(domain)]
+    pool, path = get_registry_pool(base_url)
+    if isinstance(timeout, tuple):
+        timeout = urllib3.Timeout(connect=timeout[0], read=timeout[1])
+    
+    method = "GET" if base_url in _head_rejected else "HEAD"
+    response = pool.urlopen(method, path + domain, headers=RDAP_HEADERS, timeout=timeout,
+                            retries=False, redirect=False, preload_content=False)
+    
+    location = response.get_redirect_location()
+    if location:
+        response.drain_conn()
+        response.release_conn()
+        response = get_pool_manager().urlopen(method, urljoin(url, location), timeout=timeout,
+                                              preload_content=False)
+    
+    # A few KB at most: reading them keeps the connection reusable,
+    # which is far cheaper than closing it and handshaking again
+    status = response.status
+    retry_after = response.headers.get("Retry-After")
+    response.drain_conn()
+    response.release_conn()
+    
+    if status == 405 and method == "HEAD":
+        _head_rejected.add(base_url)
+        return query_rdap(domain, timeout)
+    return status, retry_after
+
+async def query_rdap_async(client, domain, timeout=REQUEST_TIMEOUT):
+    """
+    Asynchronous counterpart of query_rdap on an httpx.AsyncClient.
+    
+    Args:
+        client (httpx.AsyncClient): Client configured to follow redirects
+        domain (str): Domain to query
+        timeout (float or tuple): Per-request timeout, or (connect, read)
+        
+    Returns:
+        tuple: (status, retry_after), as for query_rdap
+    """
+    url = rdap_url(domain)
+    base_url = url[:-len(domain)]
+    timeout = as_httpx_timeout(timeout)
+    
+    if base_url not in _head_rejected:
+        response = await client.head(url, timeout=timeout)
+        if response.status_code != 405:
+            return response.status_code, response.headers.get("Retry-After")
+        _head_rejected.add(base_url)
+    
+    # The body is read, as in query_rdap, so the connection goes back to the
+    # pool instead of being closed and handshaken again on the next query
+    response = await client.get(url, timeout=timeout)
+    return response.status_code, response.headers.get("Retry-After")
+
+def backoff_delay(attempt, retry_after=None):
+    """
+    Seconds to wait before retrying a rate-limited or failing request.
+    
+    Args:
+        attempt (int): Zero-based number of the attempt that just failed
+        retry_after (str): Raw Retry-After header, in seconds or HTTP-date
+        
+    Returns:
+        float: The server's Retry-After when it sent a valid one, else
+        exponential backoff with jitter; never above MAX_RETRY_AFTER
+    """
+    delay = None
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                pass
+    
+    if delay is None or delay < 0:
+        delay = 2 ** attempt + random.random()
+    return min(delay, MAX_RETRY_AFTER)
+
+def is_transient(status):
+    """
+    Tell whether an RDAP status is a temporary server-side condition.
+    
+    Args:
+        status (int): HTTP status code
+        
+    Returns:
+        bool: True for rate limiting (429) and server errors (5xx)
+    """
+    return status == 429 or status >= 500
+
+def classify(status):
+    """
+    Map an RDAP status code to a check outcome.
+    
+    Args:
+        status (int): HTTP status code
+        
+    Returns:
+        str: AVAILABLE (404), UNKNOWN (429/5xx) or REGISTERED (anything else)
+    """
+    if status == 404:
+        return AVAILABLE
+    if is_transient(status):
+        return UNKNOWN
+    return REGISTERED
+
+def check_domain_batch(domains_batch, timeout=REQUEST_TIMEOUT):
     """
     Process a batch of domains using RDAP protocol.
     
     Args:
         domains_batch (list): List of domain strings to check
+        timeout (float or tuple): Per-request timeout, or (connect, read)
         
     Returns:
-        list: Tuple of (domain, is_available) for each domain
+        list: Tuple of (domain, state) for each domain, state being
+        AVAILABLE, REGISTERED or UNKNOWN
         
     Note:
         Uses RDAP (Registration Data Access Protocol) which is the modern
         replacement for WHOIS. 404 response indicates domain availability.
-        Implements timeout and exception handling for robustness.
+        Requests go through the worker thread's own PoolManager so TLS
+        connections are reused across domains and batches.
+        Rate-limited (429) and 5xx answers are retried up to MAX_ATTEMPTS
+        times, waiting for the server's Retry-After or an exponential
+        backoff; the sleep also slows this worker down, easing the load on
+        the registry. Connection, TLS and timeout errors make the domain
+        UNKNOWN so the retry pass reissues it with a longer timeout.
+        Workers never write to stdout; reporting is done by the consumer.
     """
     results = []
     
     for domain in domains_batch:
-        try:
-            # RDAP endpoint for domain verification
-            response = requests.get(f"https://rdap.org/domain/{domain}", timeout=2)
-            
-            # HTTP 404 = Domain not found = Available
-            # HTTP 200 = Domain found = Registered
-            is_available = response.status_code == 404
-            results.append((domain, is_available))
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                # HTTP 404 = Domain not found = Available
+                # HTTP 200 = Domain found = Registered
+                status, retry_after = query_rdap(domain, timeout)
+            except (urllib3.exceptions.HTTPError, OSError):
+                # Network errors or timeouts say nothing about registration
+                status = None
+                break
             
-            # Real-time feedback for available domains
-            if is_available:
-                print(f"✓ DISPONIBLE: {domain}")
-                
-        except Exception:
-            # Network errors, timeouts, or invalid responses default to registered
-            results.append((domain, False))
+            if not is_transient(status) or attempt == MAX_ATTEMPTS - 1:
+                break
+            time.sleep(backoff_delay(attempt, retry_after))
+        
+        results.append((domain, UNKNOWN if status is None else classify(status)))
     
     return results
 
@@ -77,35 +605,24 @@ def generate_domains(length=3, tld=".com"):
     Generate all possible letter combinations for a given TLD.
     
     Args:
-        length (int): Domain length (3 or 4 letters)
+        length (int): Domain length (any positive number of letters)
         tld (str): Top-level domain (e.g., '.com')
         
     Returns:
-        list: All possible domain combinations
+        generator: All possible domain combinations, produced lazily
         
     Complexity:
         O(26^length) - Exponential growth with domain length
         - 3 letters: 26^3 = 17,576 combinations
         - 4 letters: 26^4 = 456,976 combinations
+        The TLD is the last factor of itertools.product and map applies
+        str.join directly, so the whole loop runs in C with no Python
+        bytecode executed per domain. Names are kept as str rather than
+        bytes: the HTTP clients, the SQLite cache and the output files all
+        take text, so bytes would only move the encode/decode step.
     """
     letters = string.ascii_lowercase
-    domains = []
-    
-    if length == 3:
-        # Triple nested loop for 3-letter combinations
-        for a in letters:
-            for b in letters:
-                for c in letters:
-                    domains.append(f"{a}{b}{c}{tld}")
-    elif length == 4:
-        # Quadruple nested loop for 4-letter combinations
-        for a in letters:
-            for b in letters:
-                for c in letters:
-                    for d in letters:
-                        domains.append(f"{a}{b}{c}{d}{tld}")
-    
-    return domains
+    return map("".join, itertools.product(*[letters] * length, (tld,)))
 
 def generate_domains_multiple(length=3, tlds=None):
     """
@@ -116,21 +633,25 @@ def generate_domains_multiple(length=3, tlds=None):
         tlds (list): List of TLD strings, defaults to ['.com']
         
     Returns:
-        list: All domain combinations across all specified TLDs
+        iterator: Domain combinations across all specified TLDs
         
     Memory Consideration:
         For 4 letters + all 50 TLDs: 456,976 * 50 = 22,848,800 domains
-        Uses streaming approach to avoid memory overload.
+        Domains are streamed one at a time, so the full set is never
+        materialized in memory.
+        
+    Ordering:
+        TLDs are interleaved per name (abc.com, abc.net, abd.com, ...) so
+        concurrent requests are spread across registries instead of
+        hammering one TLD's server at a time. Making the TLD list the last
+        factor of itertools.product gives exactly this order while keeping
+        the loop in C, as in generate_domains.
     """
     if tlds is None:
         tlds = [".com"]
     
-    all_domains = []
-    for tld in tlds:
-        domains = generate_domains(length, tld)
-        all_domains.extend(domains)
-    
-    return all_domains
+    letters = string.ascii_lowercase
+    return map("".join, itertools.product(*[letters] * length, tlds))
 
 def get_all_tlds():
     """
@@ -174,10 +695,10 @@ def get_all_tlds():
 
 def create_batches(domains, batch_size):
     """
-    Generator function to split domain list into batches for parallel processing.
+    Generator function to split domains into batches for parallel processing.
     
     Args:
-        domains (list): List of domain strings to process
+        domains (iterable): Domain strings to process, consumed lazily
         batch_size (int): Number of domains per batch
         
     Yields:
@@ -188,17 +709,354 @@ def create_batches(domains, batch_size):
         - Larger batches = Less overhead but potential load imbalance
         - Optimal size depends on network latency and processing power
     """
-    for i in range(0, len(domains), batch_size):
-        yield domains[i:i + batch_size]
+    iterator = iter(domains)
+    yield from iter(lambda: list(itertools.islice(iterator, batch_size)), [])
+
+class ProgressReporter:
+    """
+    Buffered console output for a checking run.
+    
+    Attributes:
+        total (int): Total domains in the run
+        processed (int): Domains checked so far
+        
+    Note:
+        Only the thread consuming worker results talks to this object, so
+        workers never contend on stdout: that thread is the single writer a
+        separate logger thread would otherwise provide. Available-domain
+        notices and progress lines are accumulated and written with a
+        single sys.stdout.write + flush at most every FLUSH_INTERVAL
+        seconds, however fast or slow domains complete. Each timed flush
+        starts with a progress line, so progress is shown at a steady pace
+        instead of only when the count lands on an exact multiple.
+    """
+    
+    FLUSH_INTERVAL = 1.0
+    
+    def __init__(self, total):
+        self.total = total
+        self.processed = 0
+        self._start_time = time.time()
+        self._lines = []
+        self._next_flush = time.monotonic() + self.FLUSH_INTERVAL
+    
+    def found(self, domain):
+        """Queue the real-time notice for an available domain."""
+        self._lines.append(f"✓ DISPONIBLE: {domain}\n")
+    
+    def advance(self, count):
+        """
+        Account for completed domains and emit output when due.
+        
+        Args:
+            count (int): Domains completed since the last call
+        """
+        self.processed += count
+        
+        # Clock comparison only; everything else runs about once per second
+        now = time.monotonic()
+        if now >= self._next_flush:
+            elapsed = time.time() - self._start_time
+            rate = self.processed / elapsed
+            eta = (self.total - self.processed) / rate if rate > 0 else 0
+            self._lines.append(
+                f"📈 Progreso: {self.processed:,}/{self.total:,} "
+                f"({self.processed/self.total*100:.1f}%) - "
+                f"Velocidad: {rate:.1f} dom/s - ETA: {eta:.0f}s\n")
+            self.flush()
+            self._next_flush = now + self.FLUSH_INTERVAL
+    
+    def flush(self):
+        """Write all buffered lines at once."""
+        if self._lines:
+            sys.stdout.write("".join(self._lines))
+            sys.stdout.flush()
+            self._lines = []
+
+class QueueReporter:
+    """
+    ProgressReporter stand-in for worker processes of a sharded run.
+    
+    Attributes:
+        tld (str): TLD checked by this process, tagging every message
+        
+    Note:
+        Instead of printing, progress is sent to the parent as
+        (tld, found, count, None) tuples on a multiprocessing queue, at most
+        every FLUSH_INTERVAL seconds; the parent is the only process that
+        writes to the console. The last message,
+        (tld, [], 0, (unknown, cached)), marks the TLD as finished.
+    """
+    
+    FLUSH_INTERVAL = ProgressReporter.FLUSH_INTERVAL
+    
+    def __init__(self, queue, tld):
+        self.tld = tld
+        self._queue = queue
+        self._found = []
+        self._count = 0
+        self._next_flush = time.monotonic() + self.FLUSH_INTERVAL
+    
+    def found(self, domain):
+        """Queue an available domain for the parent."""
+        self._found.append(domain)
+    
+    def advance(self, count):
+        """Account for completed domains and send them when due."""
+        self._count += count
+        now = time.monotonic()
+        if now >= self._next_flush:
+            self.flush()
+            self._next_flush = now + self.FLUSH_INTERVAL
+    
+    def flush(self):
+        """Send everything accumulated since the last message."""
+        if self._found or self._count:
+            self._queue.put((self.tld, self._found, self._count, None))
+            self._found = []
+            self._count = 0
+    
+    def finish(self, unknown, cached):
+        """Send the remaining progress and the TLD's unknown and cached counts."""
+        self.flush()
+        self._queue.put((self.tld, [], 0, (unknown, cached)))
+
+class Checkpoint:
+    """
+    Append-only record of fully processed name prefixes (shards).
+    
+    A shard is every domain sharing the name minus its last letter, across
+    all TLDs of the run: for 4 letters, 'abc' stands for abca..abcz in each
+    TLD. Completed shards are appended to the file as soon as their last
+    domain is recorded, so a rerun after Ctrl-C skips them.
+    
+    Attributes:
+        path (str): Checkpoint file location
+        shard_size (int): Domains per shard (26 * number of TLDs)
+        done (set): Shards completed in previous runs
+    """
+    
+    def __init__(self, path, shard_size):
+        self.path = path
+        self.shard_size = shard_size
+        self.done = set()
+        if os.path.exists(path):
+            with open(path) as f:
+                self.done = {line.strip() for line in f if line.strip()}
+        self._counts = {}
+        self._file = None
+    
+    @staticmethod
+    def shard(domain):
+        """Return the shard key of a domain ('abcd.com' -> 'abc')."""
+        return domain.split(".", 1)[0][:-1]
+    
+    def mark(self, domain):
+        """Count a finished domain and persist its shard once complete."""
+        shard = self.shard(domain)
+        count = self._counts.get(shard, 0) + 1
+        if count < self.shard_size:
+            self._counts[shard] = count
+            return
+        
+        self._counts.pop(shard, None)
+        if self._file is None:
+            self._file = open(self.path, "a", buffering=1)
+        self._file.write(f"{shard}\n")
+    
+    def close(self):
+        """Close the checkpoint file, keeping it for a later resume."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def remove(self):
+        """Delete the checkpoint once the whole run has finished."""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+def skip_done(domains, done_by_tld):
+    """
+    Skip domains whose shard was completed in a previous run.
+    
+    Args:
+        domains (iterable): Domain strings in generation order
+        done_by_tld (dict): TLD (with dot) -> completed shards for that TLD,
+            from the run's shared checkpoint and its per-TLD ones
+        
+    Returns:
+        iterator: Domains still to be checked, produced lazily
+    """
+    if not any(done_by_tld.values()):
+        # Fresh run: hand the C-level generator through untouched
+        return iter(domains)
+    return (domain for domain in domains
+            if Checkpoint.shard(domain) not in done_by_tld[domain[domain.index("."):]])
+
+class RunResults:
+    """
+    Sink for every finished domain of a run.
+    
+    Attributes:
+        available (list): Available domains found in this run
+        unknown (list): Domains still unknown after the retry pass
+        
+    Note:
+        Available domains are appended to output_file the moment they are
+        found (line-buffered), so an interrupted run keeps its findings.
+        Domains still unknown after their retry are appended to
+        unknown_file the same way, so the user knows they were not
+        verified. Also feeds the cache, the checkpoint and the progress
+        reporter.
+        
+    Checkpointing:
+        A domain only counts towards its checkpoint shard once its answer
+        is final. Unknown domains waiting for the retry pass stay pending,
+        so if the run is interrupted before their retry the shard is left
+        incomplete and a resumed run checks them again.
+    """
+    
+    def __init__(self, total, cache=None, output_file=None, checkpoint=None,
+                 unknown_file=None, reporter=None):
+        # A custom reporter means another process owns the console
+        self.verbose = reporter is None
+        self.available = []
+        self.unknown = []
+        self._pending = {}
+        self._cache = cache
+        self._checkpoint = checkpoint
+        self._unknown_file = unknown_file
+        self._unknown_output = None
+        self._reporter = reporter if reporter is not None else ProgressReporter(total)
+        self._output = open(output_file, "a", buffering=1) if output_file else None
+    
+    def record(self, domain, state, cached=False, retry=False):
+        """
+        Record the outcome of one domain.
+        
+        Args:
+            domain (str): Checked domain
+            state (str): AVAILABLE, REGISTERED or UNKNOWN
+            cached (bool): True if the answer came from the cache
+            retry (bool): True for the retry pass; the domain was already
+                counted for progress on its first attempt
+        """
+        if state == AVAILABLE:
+            self.available.append(domain)
+            self._reporter.found(domain)
+            if self._output is not None:
+                self._output.write(f"{domain}\n")
+        
+        if self._cache is not None and not cached:
+            self._cache.store(domain, state)
+        
+        if not retry:
+            self._reporter.advance(1)
+            if state == UNKNOWN:
+                # Not final yet: waits for the retry pass before checkpointing
+                self._pending[domain] = None
+                return
+        else:
+            self._pending.pop(domain, None)
+            if state == UNKNOWN:
+                self._save_unknown(domain)
+        
+        if self._checkpoint is not None:
+            self._checkpoint.mark(domain)
+    
+    def _save_unknown(self, domain):
+        """Record a domain whose state stays unknown, writing it out at once."""
+        self.unknown.append(domain)
+        if self._unknown_file:
+            if self._unknown_output is None:
+                self._unknown_output = open(self._unknown_file, "a", buffering=1)
+            self._unknown_output.write(f"{domain}\n")
+    
+    def take_unknown(self):
+        """
+        Hand over the unknown domains for a retry pass.
+        
+        Returns:
+            list: Unknown domains awaiting their retry; they stay pending
+            until the retry pass records them again
+        """
+        # Main-pass output goes out before any retry message
+        self._reporter.flush()
+        return list(self._pending)
+    
+    def close(self):
+        """Flush console output, close the output files and report unknowns."""
+        self._reporter.flush()
+        if self._output is not None:
+            self._output.close()
+            self._output = None
+        
+        if self._pending:
+            if self._checkpoint is not None:
+                if self.verbose:
+                    print(f"⏸️  {len(self._pending):,} dominios sin reintentar; "
+                          f"se comprobarán de nuevo al reanudar")
+            else:
+                # Without a checkpoint nothing would bring them back
+                for domain in self._pending:
+                    self._save_unknown(domain)
+            self._pending = {}
+        
+        if self._unknown_output is not None:
+            self._unknown_output.close()
+            self._unknown_output = None
+        
+        if not self.verbose:
+            cached = self._cache.hits if self._cache is not None else 0
+            self._reporter.finish(len(self.unknown), cached)
+        elif self.unknown:
+            print(f"⚠️  {len(self.unknown):,} dominios indeterminados (error o límite de peticiones)")
+            if self._unknown_file:
+                print(f"📁 Indeterminados guardados en: {self._unknown_file}")
 
-def check_domains_parallel(domains, batch_size=10, max_workers=50):
+def run_thread_pool(executor, batches, window, timeout, on_result):
+    """
+    Check batches on a thread pool with a bounded submission window.
+    
+    Args:
+        executor (ThreadPoolExecutor): Pool whose threads run the batches
+        batches (iterator): Lazily produced lists of domains
+        window (int): Maximum batches submitted at once; below the pool
+            size it also caps how many threads work concurrently
+        timeout (float or tuple): Per-request timeout, or (connect, read)
+        on_result (callable): Called as on_result(domain, state) from the
+            calling thread for every finished domain
+    """
+    pending = {executor.submit(check_domain_batch, batch, timeout)
+               for batch in itertools.islice(batches, window)}
+    
+    while pending:
+        # Process results as they complete (non-blocking)
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        
+        for future in done:
+            for domain, state in future.result():
+                on_result(domain, state)
+        
+        # Refill the window with as many batches as just finished
+        for batch in itertools.islice(batches, len(done)):
+            pending.add(executor.submit(check_domain_batch, batch, timeout))
+
+def check_domains_parallel(domains, batch_size=10, max_workers=50, cache=None, total=None,
+                           output_file=None, checkpoint=None, unknown_file=None):
     """
     Execute parallel domain checking using ThreadPoolExecutor with batching strategy.
     
     Args:
-        domains (list): List of domain strings to check
+        domains (iterable): Domain strings to check, list or generator
         batch_size (int): Number of domains per batch for processing
         max_workers (int): Maximum number of concurrent threads
+        cache (RDAPCache): Optional result cache, None disables caching
+        total (int): Number of domains, required when domains is a generator
+        output_file (str): Optional file receiving available domains as found
+        checkpoint (Checkpoint): Optional record of completed shards
+        unknown_file (str): Optional file receiving domains left unknown
         
     Returns:
         list: Available domain strings
@@ -206,17 +1064,21 @@ def check_domains_parallel(domains, batch_size=10, max_workers=50):
     Threading Strategy:
         - ThreadPoolExecutor manages thread pool lifecycle
         - Batches reduce thread creation overhead
-        - as_completed() provides results as they finish
-        - Progress tracking every 500 domains for performance
+        - Bounded submission window: at most 2 * max_workers batches are
+          in flight, so memory stays constant regardless of run size
+        - Progress printed once per second on the monotonic clock, buffered
+          by ProgressReporter
+        - Unknown domains get a second pass with RETRY_TIMEOUT and half
+          the workers, once the main pass has released the servers
         
     Performance Metrics:
         - Calculates real-time processing rate (domains/second)
         - Estimates remaining time (ETA) based on current rate
         - Tracks completion percentage for user feedback
     """
-    available_domains = []
-    total = len(domains)
-    total_batches = math.ceil(total / batch_size)
+    if total is None:
+        total = len(domains)
+    total_batches = -(-total // batch_size)
     
     print(f"🔍 Estrategia: {batch_size} dominios por lote")
     print(f"📊 Total lotes: {total_batches}")
@@ -224,102 +1086,696 @@ def check_domains_parallel(domains, batch_size=10, max_workers=50):
     print(f"🎯 Verificando {total:,} dominios...")
     print()
     
-    # Convert generator to list for multiple iterations
-    batches = list(create_batches(domains, batch_size))
+    results = RunResults(total, cache, output_file, checkpoint, unknown_file)
+    batches = create_batches(apply_cache(domains, cache, results), batch_size)
     
-    start_time = time.time()
-    processed = 0
+    try:
+        # One pool for both passes: worker threads, and so their
+        # PoolManagers, survive into the retry pass with connections open
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            run_thread_pool(executor, batches, max_workers * 2, REQUEST_TIMEOUT,
+                            results.record)
+            
+            unknown = results.take_unknown()
+            if unknown:
+                retry_workers = max(1, max_workers // 2)
+                print(f"\n🔁 Reintentando {len(unknown):,} dominios indeterminados "
+                      f"({RETRY_TIMEOUT}s, {retry_workers} workers)...")
+                run_thread_pool(executor, create_batches(unknown, batch_size), retry_workers,
+                                RETRY_TIMEOUT,
+                                lambda domain, state: results.record(domain, state, retry=True))
+    finally:
+        results.close()
+    
+    return results.available
+
+async def is_delegated(resolver, domain):
+    """
+    Tell whether a domain has NS records published in DNS.
     
-    # Thread pool execution with future tracking
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all batch jobs and map futures to batches
-        future_to_batch = {executor.submit(check_domain_batch, batch): batch 
-                          for batch in batches}
+    Args:
+        resolver (aiodns.DNSResolver): Shared asynchronous resolver
+        domain (str): Domain to look up
         
-        # Process results as they complete (non-blocking)
-        for future in as_completed(future_to_batch):
-            batch_results = future.result()
+    Returns:
+        bool: True if the NS query succeeded, False on NXDOMAIN or any
+        other DNS failure (which then falls through to RDAP)
+        
+    Note:
+        aiodns 3.3 added query_dns and deprecated query; the older call is
+        only used on releases that lack it.
+    """
+    query = getattr(resolver, "query_dns", None) or resolver.query
+    try:
+        await query(domain, "NS")
+    except aiodns.error.DNSError:
+        return False
+    return True
+
+async def check_one(client, sem, tld_sems, domain, resolver=None, timeout=REQUEST_TIMEOUT):
+    """
+    Check a single domain over the shared asynchronous HTTP client.
+    
+    Args:
+        client (httpx.AsyncClient): Pooled client reused for the whole run
+        sem (asyncio.Semaphore): Caps the number of in-flight requests
+        tld_sems (dict): TLD -> asyncio.Semaphore capping per-registry load
+        domain (str): Domain to check
+        resolver (aiodns.DNSResolver): Optional DNS prefilter, None skips it
+        timeout (float or tuple): Per-request timeout, or (connect, read)
+        
+    Returns:
+        tuple: (domain, state), state being AVAILABLE, REGISTERED or UNKNOWN
+        
+    Note:
+        Same classification and retry policy as check_domain_batch:
+        Rate-limited (429) and 5xx answers are retried up to MAX_ATTEMPTS
+        times, honouring Retry-After, instead of being recorded; if they
+        persist, or the request fails, the domain is UNKNOWN.
+        
+    DNS Prefilter:
+        A delegated domain (NS records resolve) is necessarily registered,
+        so it is reported as REGISTERED without an RDAP query. One UDP round-trip
+        replaces an HTTPS request for the vast majority of names; only
+        NXDOMAIN candidates pay the RDAP cost.
+    """
+    if resolver is not None and await is_delegated(resolver, domain):
+        return domain, REGISTERED
+    
+    tld = domain.rsplit(".", 1)[-1]
+    tld_sem = tld_sems.get(tld)
+    if tld_sem is None:
+        tld_sem = tld_sems[tld] = asyncio.Semaphore(PER_TLD_CONCURRENCY)
+    
+    for attempt in range(MAX_ATTEMPTS):
+        # Per-TLD slot first so a busy registry never holds a global slot
+        async with tld_sem, sem:
+            try:
+                status, retry_after = await query_rdap_async(client, domain, timeout)
+            except (httpx.HTTPError, OSError):
+                return domain, UNKNOWN
+        
+        if not is_transient(status) or attempt == MAX_ATTEMPTS - 1:
+            break
+        
+        # Backoff happens outside both semaphores, freeing the slots
+        await asyncio.sleep(backoff_delay(attempt, retry_after))
+    
+    return domain, classify(status)
+
+async def run_tasks(client, domains, concurrency, tld_sems, resolver, timeout, on_result):
+    """
+    Drive check_one over domains with a bounded task window.
+    
+    Args:
+        client (httpx.AsyncClient): Shared client
+        domains (iterator): Domain strings, consumed lazily
+        concurrency (int): Maximum simultaneous RDAP requests
+        tld_sems (dict): Per-TLD semaphores shared across passes
+        resolver (aiodns.DNSResolver): Optional DNS prefilter
+        timeout (float or tuple): Per-request timeout, or (connect, read)
+        on_result (callable): Called as on_result(domain, state)
+    """
+    sem = asyncio.Semaphore(concurrency)
+    
+    # Same sliding-window pattern as the threaded strategy: at most
+    # 2 * concurrency tasks exist at once, refilled as they complete
+    window = concurrency * 2
+    
+    def start(domain):
+        return asyncio.ensure_future(
+            check_one(client, sem, tld_sems, domain, resolver, timeout))
+    
+    pending = {start(domain) for domain in itertools.islice(domains, window)}
+    
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            
+            for task in done:
+                on_result(*task.result())
             
-            # Collect available domains from batch results
-            for domain, is_available in batch_results:
-                if is_available:
-                    available_domains.append(domain)
+            for domain in itertools.islice(domains, len(done)):
+                pending.add(start(domain))
+    finally:
+        # Cancelled (Ctrl+C): stop the window before the client closes under it
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+def create_async_client(concurrency):
+    """
+    Build the httpx client shared by every request of an async pass.
+    
+    Args:
+        concurrency (int): Maximum simultaneous requests the client serves
+        
+    Returns:
+        httpx.AsyncClient: Client to be used as an async context manager
+    """
+    # Pool matches the semaphore so requests never wait on the pool
+    limits = httpx.Limits(max_connections=concurrency,
+                          max_keepalive_connections=concurrency,
+                          keepalive_expiry=60)
+    
+    # rdap.org redirects to the registry; httpx does not follow by default.
+    # HTTP/2 multiplexes concurrent requests to a registry over a single
+    # TLS connection; HTTP/1.1-only servers still get up to `concurrency`
+    # pooled sockets.
+    return httpx.AsyncClient(limits=limits, timeout=as_httpx_timeout(REQUEST_TIMEOUT),
+                             headers=RDAP_HEADERS, follow_redirects=True, http2=True)
+
+def run_event_loop(coro):
+    """
+    Run a coroutine to completion, on uvloop when it is installed.
+    
+    Args:
+        coro (coroutine): Coroutine to run
+        
+    Returns:
+        object: The coroutine's return value
+        
+    Note:
+        signal_handler would raise SystemExit inside whichever task is
+        running, and asyncio then reports it as never retrieved with a
+        full traceback. While the loop runs, SIGINT goes back to the
+        default handler so asyncio cancels every task cleanly, and the
+        resulting KeyboardInterrupt leaves through signal_handler.
+        Worker processes ignore SIGINT and keep doing so.
+    """
+    previous = signal.getsignal(signal.SIGINT)
+    if previous is signal_handler:
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+    try:
+        if uvloop is None:
+            return asyncio.run(coro)
+        if hasattr(uvloop, "run"):
+            return uvloop.run(coro)
+        # uvloop before 0.18 has no run(); its policy makes asyncio use it
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return asyncio.run(coro)
+    except KeyboardInterrupt:
+        signal_handler(signal.SIGINT, None)
+    finally:
+        if previous is signal_handler:
+            signal.signal(signal.SIGINT, previous)
+
+async def _check_domains_async(domains, concurrency, cache, results, dns_prefilter):
+    """
+    Coroutine running the main pass and the retry pass of unknown domains.
+    
+    Args:
+        domains (iterable): Domain strings to check, list or generator
+        concurrency (int): Maximum simultaneous RDAP requests
+        cache (RDAPCache): Optional result cache, None disables caching
+        results (RunResults): Sink for every finished domain
+        dns_prefilter (bool): Skip RDAP for names delegated in DNS
+    """
+    domains = apply_cache(domains, cache, results)
+    tld_sems = {}
+    resolver = aiodns.DNSResolver() if dns_prefilter else None
+    
+    async with create_async_client(concurrency) as client:
+        await run_tasks(client, domains, concurrency, tld_sems, resolver,
+                        REQUEST_TIMEOUT, results.record)
+        
+        unknown = results.take_unknown()
+        if unknown:
+            retry_concurrency = max(1, concurrency // 2)
+            if results.verbose:
+                print(f"\n🔁 Reintentando {len(unknown):,} dominios indeterminados "
+                      f"({RETRY_TIMEOUT}s, {retry_concurrency} peticiones simultáneas)...")
+            await run_tasks(client, iter(unknown), retry_concurrency, tld_sems, None,
+                            RETRY_TIMEOUT,
+                            lambda domain, state: results.record(domain, state, retry=True))
+
+def check_domains_async(domains, concurrency=DEFAULT_CONCURRENCY, cache=None, total=None, dns_prefilter=True,
+                        output_file=None, checkpoint=None, unknown_file=None, reporter=None):
+    """
+    Execute domain checking on a single asyncio event loop.
+    
+    Args:
+        domains (iterable): Domain strings to check, list or generator
+        concurrency (int): Maximum simultaneous RDAP requests
+        cache (RDAPCache): Optional result cache, None disables caching
+        total (int): Number of domains, required when domains is a generator
+        dns_prefilter (bool): Use DNS NS lookups to skip registered names;
+            ignored when aiodns is not installed
+        output_file (str): Optional file receiving available domains as found
+        checkpoint (Checkpoint): Optional record of completed shards
+        unknown_file (str): Optional file receiving domains left unknown
+        reporter (QueueReporter): Optional progress sink replacing console
+            output, used by the worker processes of a sharded run
+        
+    Returns:
+        list: Available domain strings
+        
+    Async Strategy:
+        - One coroutine per domain instead of one OS thread per worker
+        - A single httpx.AsyncClient keeps connections alive for the run
+        - HTTP/2 lets hundreds of in-flight requests share one TLS session
+          per registry, amortizing handshakes by the multiplex factor
+        - Bounded task window keeps memory constant for generator input
+        - In-flight requests can reach the hundreds or thousands at a
+          fraction of the memory a thread pool of that size would need
+        - Runs on uvloop when installed (Linux/macOS), which cuts event
+          loop and socket syscall overhead compared to the default loop
+        - Unknown domains get a second pass with RETRY_TIMEOUT and half
+          the concurrency
+    """
+    if total is None:
+        total = len(domains)
+    dns_prefilter = dns_prefilter and aiodns is not None
+    
+    results = RunResults(total, cache, output_file, checkpoint, unknown_file, reporter)
+    if results.verbose:
+        print("🔍 Estrategia: asíncrona")
+        print(f"⚡ Peticiones simultáneas: {concurrency}")
+        if dns_prefilter:
+            print("🧭 Prefiltro DNS: activo")
+        print(f"🎯 Verificando {total:,} dominios...")
+        print()
+    
+    try:
+        run_event_loop(_check_domains_async(domains, concurrency, cache, results, dns_prefilter))
+    finally:
+        results.close()
+    
+    return results.available
+
+# Async jobs above this many domains are split across processes, one TLD
+# per task, so TLS and HTTP parsing are not capped by a single core
+SHARD_THRESHOLD = 100_000
+
+# Progress queue of a sharded run, set in each worker process
+_progress_queue = None
+
+def _init_shard_process(rdap_servers, progress_queue):
+    """
+    Prepare a worker process of check_domains_sharded.
+    
+    Args:
+        rdap_servers (dict): Bootstrap registry loaded by the parent; passed
+            explicitly because spawned processes do not inherit globals
+        progress_queue (multiprocessing.Queue): Where QueueReporter sends
+            progress for the parent to print
+    """
+    global _progress_queue
+    # Ctrl+C is handled by the parent, which terminates the pool. Nothing
+    # is lost: unknown domains only reach the checkpoint once final.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    enable_dns_cache()
+    _rdap_servers.update(rdap_servers)
+    _progress_queue = progress_queue
+
+def _check_tld_process(job):
+    """
+    Run the asynchronous strategy over every name of one TLD.
+    
+    Args:
+        job (tuple): (length, tld, concurrency, cache_ttl, dns_prefilter,
+            output_file, unknown_file, checkpoint_path, done)
+            
+    Note:
+        The run's RunResults sends the TLD's final message on the progress
+        queue when it closes.
+    """
+    (length, tld, concurrency, cache_ttl, dns_prefilter,
+     output_file, unknown_file, checkpoint_path, done) = job
+    
+    # Processes share the SQLite file; committing every store keeps each
+    # write lock short enough that no event loop waits on another process
+    cache = None
+    if cache_ttl is not None:
+        cache = RDAPCache(ttl_available=cache_ttl, ttl_registered=cache_ttl * 7,
+                          commit_every=1)
+    
+    checkpoint = Checkpoint(checkpoint_path, 26)
+    reporter = QueueReporter(_progress_queue, tld)
+    domains = skip_done(generate_domains(length, tld), {tld: done})
+    try:
+        check_domains_async(domains, concurrency, cache=cache,
+                            total=26 ** length - len(done) * 26,
+                            dns_prefilter=dns_prefilter, output_file=output_file,
+                            checkpoint=checkpoint, unknown_file=unknown_file,
+                            reporter=reporter)
+    finally:
+        checkpoint.close()
+        if cache is not None:
+            cache.close()
+
+def check_domains_sharded(length, tlds, concurrency, processes, total, cache_ttl=None,
+                          dns_prefilter=True, output_file=None, unknown_file=None,
+                          checkpoint_paths=None, done_by_tld=None):
+    """
+    Split a large asynchronous job across processes, one TLD per task.
+    
+    Args:
+        length (int): Domain length in letters
+        tlds (list): TLD strings to check
+        concurrency (int): Simultaneous requests across all processes
+        processes (int): Worker processes to start
+        total (int): Domains still to check across all TLDs
+        cache_ttl (int): Cache TTL in seconds for available results, None
+            disables caching
+        dns_prefilter (bool): Passed through to check_domains_async
+        output_file (str): Optional file receiving available domains as found
+        unknown_file (str): Optional file receiving domains left unknown
+        checkpoint_paths (dict): TLD -> checkpoint file of that TLD
+        done_by_tld (dict): TLD -> shards completed in previous runs
+        
+    Returns:
+        list: Available domain strings
+        
+    Note:
+        A single event loop saturates one core on TLS and HTTP parsing
+        long before the network is the limit. Each process runs its own
+        loop and client over whole TLDs, so per-registry limits still hold
+        and a TLD's checkpoint shards are always completed by one process.
+        The output files are appended to line by line, which is safe
+        across processes. Workers report progress through a queue and
+        only this process prints.
+    """
+    # Each process works on one TLD at a time, which PER_TLD_CONCURRENCY caps
+    per_process = max(1, min(PER_TLD_CONCURRENCY, concurrency // processes))
+    jobs = [(length, tld, per_process, cache_ttl, dns_prefilter, output_file,
+             unknown_file, checkpoint_paths[tld], done_by_tld[tld]) for tld in tlds]
+    
+    print(f"🧩 Repartiendo {len(tlds)} TLDs entre {processes} procesos "
+          f"({per_process} peticiones simultáneas cada uno)")
+    print(f"🎯 Verificando {total:,} dominios...")
+    print()
+    
+    reporter = ProgressReporter(total)
+    available = []
+    unknown = 0
+    cached = 0
+    finished = 0
+    progress_queue = multiprocessing.Queue()
+    
+    with multiprocessing.Pool(processes, _init_shard_process,
+                              (dict(_rdap_servers), progress_queue)) as pool:
+        tasks = pool.map_async(_check_tld_process, jobs)
+        while finished < len(jobs):
+            try:
+                tld, found, count, totals = progress_queue.get(timeout=0.5)
+            except queue.Empty:
+                if tasks.ready() and not tasks.successful():
+                    tasks.get()  # Re-raise the worker's exception
+                continue
             
-            processed += len(batch_results)
+            for domain in found:
+                reporter.found(domain)
+            available.extend(found)
+            if count:
+                reporter.advance(count)
             
-            # Progress reporting every 500 domains (performance optimization)
-            if processed % 500 == 0:
-                elapsed = time.time() - start_time
-                rate = processed / elapsed
-                eta = (total - processed) / rate if rate > 0 else 0
-                print(f"📈 Progreso: {processed:,}/{total:,} ({processed/total*100:.1f}%) - "
-                      f"Velocidad: {rate:.1f} dom/s - ETA: {eta:.0f}s")
+            if totals is not None:
+                finished += 1
+                unknown += totals[0]
+                cached += totals[1]
+                reporter.flush()
+                print(f"✅ {tld} completado ({finished}/{len(jobs)} TLDs)")
+        tasks.get()  # Re-raise any worker exception
     
-    return available_domains
+    reporter.flush()
+    if cached:
+        print(f"📦 Caché: {cached:,} dominios ya verificados")
+    if unknown:
+        print(f"⚠️  {unknown:,} dominios indeterminados (error o límite de peticiones)")
+        if unknown_file:
+            print(f"📁 Indeterminados guardados en: {unknown_file}")
+    
+    return available
+
+# Concurrency levels swept by the benchmark on the asynchronous strategy.
+# RDAP checks are almost pure network wait, so the useful range starts
+# well above what a thread pool can sustain.
+BENCHMARK_CONCURRENCY = [50, 100, 200, 500, 1000]
+
+# Domains probed per benchmark level: BENCHMARK_ROUNDS times the level,
+# so the window is refilled several times and the rate reflects steady
+# throughput rather than one burst timed by its slowest request. At least
+# BENCHMARK_SAMPLE, and levels needing more than BENCHMARK_MAX_SAMPLE are
+# not swept.
+BENCHMARK_SAMPLE = 500
+BENCHMARK_ROUNDS = 4
+BENCHMARK_MAX_SAMPLE = 4000
+
+# A level within this fraction of the best rate counts as the plateau
+BENCHMARK_KNEE = 0.9
+
+# Latency probe sizing the automatic strategy (Little's Law:
+# in-flight requests = target rate x latency)
+PROBE_REQUESTS = 50
+AUTO_TARGET_RPS = 1000
+AUTO_HEADROOM = 1.5
+AUTO_MIN_CONCURRENCY = 50
+AUTO_MAX_CONCURRENCY = 1000
+
+# Used when too few probe requests succeed to trust the median
+AUTO_FALLBACK_CONCURRENCY = 200
 
-def benchmark_strategies(test_domains):
+def concurrency_cap(tlds):
     """
-    Benchmark different parallel processing strategies to find optimal configuration.
+    Most simultaneous requests a run over these TLDs can have in flight.
     
     Args:
-        test_domains (list): Sample domain list for testing (typically 1000 domains)
+        tlds (list): TLD strings of the run
         
     Returns:
-        tuple: (optimal_batch_size, optimal_workers)
+        int: PER_TLD_CONCURRENCY for every distinct TLD; a higher global
+        concurrency only adds tasks waiting on the per-TLD semaphores
+    """
+    return PER_TLD_CONCURRENCY * len(set(tlds))
+
+async def warm_up(client, domains):
+    """
+    Open each registry connection with one untimed query per TLD.
+    
+    Args:
+        client (httpx.AsyncClient): Client whose pool is warmed up
+        domains (list): Domains to pick one query per TLD from
         
-    Strategy Matrix:
-        Tests various combinations of batch sizes and worker counts:
-        - Small batches + many workers: Maximum parallelism, high overhead
-        - Large batches + few workers: Minimum overhead, potential bottlenecks
-        - Balanced configurations: Optimal trade-off point
+    Note:
+        Keeps TCP and TLS handshakes out of whatever is timed next on the
+        same client. Failures are ignored; the query only opens the pool.
+    """
+    first = {domain.rsplit(".", 1)[-1]: domain for domain in domains}
+    await asyncio.gather(*(query_rdap_async(client, domain) for domain in first.values()),
+                         return_exceptions=True)
+
+async def _probe_latencies(domains):
+    """
+    Time one RDAP query per domain over a warmed-up client.
+    
+    Args:
+        domains (list): Probe domains
         
-    Selection Criteria:
-        Chooses strategy with minimum execution time for the given environment.
-        Accounts for network latency, CPU cores, and system resources.
+    Returns:
+        list: Latency in seconds per domain, None where the query failed
     """
-    print("🧪 Benchmark de estrategias...")
-    print("=" * 60)
+    async def timed(client, domain):
+        start = time.monotonic()
+        try:
+            await query_rdap_async(client, domain)
+        except Exception:
+            return None
+        return time.monotonic() - start
     
-    # Strategy matrix: (batch_size, max_workers)
-    strategies = [
-        (1, 100),   # Maximum parallelism, highest overhead
-        (4, 75),    # High parallelism, moderate overhead
-        (5, 50),    # High parallelism, lower overhead  
-        (10, 30),   # Balanced configuration (default)
-        (20, 20),   # Moderate parallelism, low overhead
-        (50, 10),   # Minimum parallelism, lowest overhead
-    ]
+    async with create_async_client(len(domains)) as client:
+        await warm_up(client, domains)
+        return await asyncio.gather(*(timed(client, domain) for domain in domains))
+
+def auto_concurrency(domains, target_rps=AUTO_TARGET_RPS, max_concurrency=AUTO_MAX_CONCURRENCY):
+    """
+    Size the asynchronous strategy from the measured RDAP latency.
     
-    results = []
+    Args:
+        domains (list): Probe domains, typically PROBE_REQUESTS of them
+        target_rps (float): Request rate the run should sustain
+        max_concurrency (int): Upper bound, normally the lower of
+            AUTO_MAX_CONCURRENCY and concurrency_cap for the run's TLDs
+        
+    Returns:
+        int: Simultaneous requests, within AUTO_MIN_CONCURRENCY and
+        max_concurrency
+        
+    Note:
+        By Little's Law, sustaining target_rps with median latency L needs
+        target_rps * L requests in flight; AUTO_HEADROOM covers the slower
+        tail. Falls back to AUTO_FALLBACK_CONCURRENCY if fewer than half
+        the probes succeed.
+    """
+    print(f"📡 Midiendo latencia RDAP con {len(domains)} peticiones...")
+    latencies = [latency for latency in run_event_loop(_probe_latencies(domains))
+                 if latency is not None]
+    
+    if len(latencies) < len(domains) / 2:
+        concurrency = min(AUTO_FALLBACK_CONCURRENCY, max_concurrency)
+        print(f"⚠️  Sondeo fallido, usando {concurrency} peticiones simultáneas")
+        return concurrency
     
-    for batch_size, workers in strategies:
-        print(f"\n🔧 Probando: {batch_size} dominios/lote, {workers} workers")
+    latency = statistics.median(latencies)
+    concurrency = int(AUTO_HEADROOM * latency * target_rps)
+    concurrency = min(max_concurrency, max(AUTO_MIN_CONCURRENCY, concurrency))
+    print(f"⏱️  Latencia mediana: {latency * 1000:.0f} ms → {concurrency} peticiones simultáneas")
+    return concurrency
+
+def sample_domains(length, tlds, count):
+    """
+    Pick distinct random domains from the full combination space.
+    
+    Args:
+        length (int): Domain length in letters
+        tlds (list): TLD strings to draw from
+        count (int): Number of domains to return
         
-        # Execute strategy with timing
-        start = time.time()
-        available = check_domains_parallel(test_domains, batch_size, workers)
-        elapsed = time.time() - start
+    Returns:
+        list: Random domain strings without repetition
         
-        # Calculate performance metrics
-        rate = len(test_domains) / elapsed
-        results.append((batch_size, workers, elapsed, rate, len(available)))
+    Note:
+        Indices are sampled and decoded in base 26, so the space of up to
+        22.8M combinations is never generated just to draw a sample.
+    """
+    letters = string.ascii_lowercase
+    space = 26 ** length * len(tlds)
+    domains = []
+    
+    for index in random.sample(range(space), min(count, space)):
+        index, tld_index = divmod(index, len(tlds))
+        name = []
+        for _ in range(length):
+            index, letter = divmod(index, 26)
+            name.append(letters[letter])
+        domains.append("".join(reversed(name)) + tlds[tld_index])
+    
+    return domains
+
+def benchmark_levels(tlds):
+    """
+    Concurrency levels worth sweeping for a run over these TLDs.
+    
+    Args:
+        tlds (list): TLD strings of the run
         
-        print(f"⏱️  Tiempo: {elapsed:.1f}s - Velocidad: {rate:.1f} dom/s - Encontrados: {len(available)}")
+    Returns:
+        list: BENCHMARK_CONCURRENCY levels below concurrency_cap(tlds),
+        followed by the cap itself when it is lower than the last level.
+        Levels whose sample would exceed BENCHMARK_MAX_SAMPLE are dropped.
+    """
+    cap = concurrency_cap(tlds)
+    largest = BENCHMARK_MAX_SAMPLE // BENCHMARK_ROUNDS
+    levels = [level for level in BENCHMARK_CONCURRENCY if level < cap and level <= largest]
+    if cap < BENCHMARK_CONCURRENCY[-1] and cap <= largest:
+        levels.append(cap)
+    return levels
+
+def benchmark_sample_size(level):
+    """
+    Domains checked at one benchmark level.
+    
+    Args:
+        level (int): Simultaneous requests of the level
+        
+    Returns:
+        int: BENCHMARK_ROUNDS windows of the level, at least BENCHMARK_SAMPLE
+    """
+    return max(BENCHMARK_SAMPLE, BENCHMARK_ROUNDS * level)
+
+async def _benchmark_levels(test_domains, levels, dns_prefilter):
+    """
+    Coroutine timing one slice of test_domains per concurrency level.
+    
+    Args:
+        test_domains (list): Random sample, one disjoint slice of
+            benchmark_sample_size(level) domains per level
+        levels (list): Simultaneous requests to try, in order
+        dns_prefilter (bool): Skip RDAP for names delegated in DNS
+        
+    Returns:
+        list: (concurrency, elapsed, rate, found) per level
+    """
+    resolver = aiodns.DNSResolver() if dns_prefilter and aiodns is not None else None
+    measurements = []
+    offset = 0
+    
+    async with create_async_client(max(levels)) as client:
+        await warm_up(client, test_domains)
+        
+        for concurrency in levels:
+            print(f"\n🔧 Probando: {concurrency} peticiones simultáneas")
+            level_domains = test_domains[offset:offset + benchmark_sample_size(concurrency)]
+            offset += len(level_domains)
+            results = RunResults(len(level_domains))
+            
+            # Execute level with timing
+            start = time.monotonic()
+            await run_tasks(client, iter(level_domains), concurrency, {}, resolver,
+                            REQUEST_TIMEOUT, results.record)
+            elapsed = time.monotonic() - start
+            results.close()
+            
+            # Calculate performance metrics
+            rate = len(level_domains) / elapsed
+            measurements.append((concurrency, elapsed, rate, len(results.available)))
+            
+            print(f"⏱️  Tiempo: {elapsed:.1f}s - Velocidad: {rate:.1f} dom/s - "
+                  f"Encontrados: {len(results.available)}")
+    
+    return measurements
+
+def benchmark_concurrency(test_domains, levels, dns_prefilter=True):
+    """
+    Sweep asynchronous concurrency levels to find the throughput knee.
+    
+    Args:
+        test_domains (list): Random sample, split into one disjoint slice of
+            benchmark_sample_size(level) domains per level
+        levels (list): Simultaneous requests to try, from benchmark_levels
+        dns_prefilter (bool): Use the DNS prefilter so the sweep measures
+            the same pipeline as the real run
+        
+    Returns:
+        int: Selected number of simultaneous requests
+        
+    Fairness:
+        Each level checks different domains, so later levels do not benefit
+        from answers already warm in registry or DNS caches. All levels
+        share one client, warmed up with a query per TLD before the first
+        level, so no timed window pays the TLS handshakes. Levels above
+        concurrency_cap are never tried: the per-TLD semaphores would hold
+        them at the cap. Each level's sample is several times the level,
+        so a high level is not timed as one burst.
+        
+    Selection Criteria:
+        Throughput rises with concurrency until the registries start
+        queueing or rate limiting, then flattens or drops. The lowest level
+        within BENCHMARK_KNEE of the best rate is chosen: past the knee more
+        in-flight requests only add 429s and server load.
+    """
+    print("🧪 Benchmark de concurrencia...")
+    print("=" * 60)
+    
+    results = run_event_loop(_benchmark_levels(test_domains, levels, dns_prefilter))
+    
+    # Lowest concurrency on the plateau
+    best_rate = max(rate for _, _, rate, _ in results)
+    best = next(concurrency for concurrency, _, rate, _ in results
+                if rate >= BENCHMARK_KNEE * best_rate)
     
     # Display comprehensive results
     print("\n🏆 Resultados del benchmark:")
-    print("Lote\tWorkers\tTiempo(s)\tVelocidad(dom/s)\tEncontrados")
+    print("Simultáneas\tTiempo(s)\tVelocidad(dom/s)\tEncontrados")
     print("-" * 60)
     
-    # Select optimal strategy (minimum execution time)
-    best_strategy = min(results, key=lambda x: x[2])
+    for concurrency, elapsed, rate, found in results:
+        marker = " ⭐" if concurrency == best else ""
+        print(f"{concurrency}\t\t{elapsed:.1f}\t\t{rate:.1f}\t\t\t{found}{marker}")
     
-    for batch_size, workers, elapsed, rate, found in results:
-        marker = " ⭐" if (batch_size, workers) == (best_strategy[0], best_strategy[1]) else ""
-        print(f"{batch_size}\t{workers}\t{elapsed:.1f}\t\t{rate:.1f}\t\t{found}{marker}")
-    
-    print(f"\n🎯 Mejor estrategia: {best_strategy[0]} dominios/lote, {best_strategy[1]} workers")
-    return best_strategy[0], best_strategy[1]
+    print(f"\n🎯 Mejor concurrencia: {best} peticiones simultáneas")
+    return best
 
 def display_tld_menu():
     """Muestra menú interactivo de TLDs en 3 columnas con selección múltiple"""
@@ -457,6 +1913,28 @@ def signal_handler(sig, frame):
     print("¡Hasta pronto! 🔍")
     sys.exit(0)
 
+def parse_args(argv=None):
+    """
+    Parse command-line options.
+    
+    Args:
+        argv (list): Arguments to parse, defaults to sys.argv[1:]
+        
+    Returns:
+        argparse.Namespace: Parsed options (no_cache, cache_ttl, no_dns)
+    """
+    parser = argparse.ArgumentParser(
+        description="Buscador paralelo de dominios disponibles vía RDAP")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="no leer ni guardar resultados en la caché RDAP")
+    parser.add_argument("--cache-ttl", type=float, default=CACHE_TTL_AVAILABLE / 3600,
+                        metavar="HORAS",
+                        help="validez en horas de un resultado 'disponible' en caché; "
+                             "los registrados se conservan 7 veces más (por defecto: 24)")
+    parser.add_argument("--no-dns", action="store_true",
+                        help="no usar el prefiltro DNS (NS) en la estrategia asíncrona")
+    return parser.parse_args(argv)
+
 def main():
     """
     Main application entry point with complete user workflow.
@@ -467,7 +1945,7 @@ def main():
         3. Configure domain length (3 or 4 letters)
         4. Select processing strategy (benchmark or manual)
         5. Execute domain availability check
-        6. Save results to timestamped file
+        6. Save results to file (incrementally, with resumable checkpoint)
         7. Display comprehensive statistics
         
     User Experience:
@@ -476,9 +1954,17 @@ def main():
         - Error handling and validation
         - Graceful interruption support
     """
+    args = parse_args()
+    
     # Configure signal handler for graceful shutdown
     signal.signal(signal.SIGINT, signal_handler)
     
+    # Resolve registry hostnames once instead of on every new connection
+    enable_dns_cache()
+    
+    # Resolve authoritative RDAP servers once for the whole session
+    _rdap_servers.update(load_rdap_bootstrap())
+    
     # Mostrar banner y menú TLD
     selected_tlds = display_tld_menu()
     
@@ -515,20 +2001,28 @@ def main():
     
     # Estrategia de procesamiento
     print(f"\n⚙️  ESTRATEGIA DE PROCESAMIENTO:")
-    print("1. Automática (benchmark recomendado) 🎯")
-    print("2. Rápida (1 dominio/lote, 100 workers) ⚡")
-    print("3. Balanceada (10 dominios/lote, 30 workers) ⚖️")
-    print("4. Estable (50 dominios/lote, 10 workers) 🐢")
-    print("5. Personalizada 🔧")
+    print("1. Benchmark (barrido de concurrencia asíncrona) 🎯")
+    print("2. Automática (según latencia medida, recomendada) 🚀")
+    print("3. Estable (50 dominios/lote, 10 workers) 🐢")
+    print("4. Personalizada (asíncrona, concurrencia a elegir) 🔧")
+    
+    # Set by the asynchronous strategies (options 1, 2 and 4). More than
+    # PER_TLD_CONCURRENCY per TLD would only wait on the per-TLD semaphores.
+    concurrency = None
+    max_concurrency = min(AUTO_MAX_CONCURRENCY, concurrency_cap(selected_tlds))
     
     while True:
         try:
-            strategy_choice = int(input("Elige estrategia [1-5]: "))
+            # Enter sin número elige la estrategia asíncrona
+            strategy_choice = int(input("Elige estrategia [1-4, Enter = 2]: ") or "2")
             if strategy_choice == 1:
                 # Benchmark con muestra
-                print("\n🧪 Ejecutando benchmark con 1000 dominios de muestra...")
-                test_domains = generate_domains_multiple(length, selected_tlds)[:1000]
-                batch_size, workers = benchmark_strategies(test_domains)
+                levels = benchmark_levels(selected_tlds)
+                sample_size = sum(benchmark_sample_size(level) for level in levels)
+                print(f"\n🧪 Ejecutando benchmark con {sample_size} dominios de muestra...")
+                test_domains = sample_domains(length, selected_tlds, sample_size)
+                concurrency = benchmark_concurrency(test_domains, levels,
+                                                    dns_prefilter=not args.no_dns)
                 try:
                     input("\n🚀 Presiona Enter para iniciar búsqueda completa...")
                 except KeyboardInterrupt:
@@ -537,22 +2031,28 @@ def main():
                     sys.exit(0)
                 break
             elif strategy_choice == 2:
-                batch_size, workers = 1, 100
+                probe = sample_domains(length, selected_tlds, PROBE_REQUESTS)
+                concurrency = auto_concurrency(probe, max_concurrency=max_concurrency)
                 break
             elif strategy_choice == 3:
-                batch_size, workers = 10, 30
-                break
-            elif strategy_choice == 4:
                 batch_size, workers = 50, 10
                 break
-            elif strategy_choice == 5:
-                try:
-                    batch_size = int(input("Dominios por lote [1-100]: ") or "10")
-                    workers = int(input("Número de workers [1-200]: ") or "30")
-                except KeyboardInterrupt:
-                    print("\n\n👋 Saliendo de Domain Finder...")
-                    print("¡Hasta pronto! 🔍")
-                    sys.exit(0)
+            elif strategy_choice == 4:
+                default = min(DEFAULT_CONCURRENCY, max_concurrency)
+                while True:
+                    try:
+                        value = int(input(f"Peticiones simultáneas [1-{AUTO_MAX_CONCURRENCY}, "
+                                          f"Enter = {default}]: ") or str(default))
+                        if 1 <= value <= AUTO_MAX_CONCURRENCY:
+                            concurrency = value
+                            break
+                        print(f"❌ Ingresa un número entre 1 y {AUTO_MAX_CONCURRENCY}")
+                    except ValueError:
+                        print("❌ Ingresa un número válido")
+                    except KeyboardInterrupt:
+                        print("\n\n👋 Saliendo de Domain Finder...")
+                        print("¡Hasta pronto! 🔍")
+                        sys.exit(0)
                 break
             else:
                 print("❌ Opción inválida")
@@ -563,22 +2063,100 @@ def main():
             print("¡Hasta pronto! 🔍")
             sys.exit(0)
     
+    if concurrency is not None and concurrency > max_concurrency:
+        print(f"ℹ️  Limitado a {max_concurrency} peticiones simultáneas "
+              f"({PER_TLD_CONCURRENCY} por TLD)")
+        concurrency = max_concurrency
+    
     # Iniciar búsqueda
     print(f"\n🚀 INICIANDO BÚSQUEDA COMPLETA...")
-    print(f"📊 Estrategia: {batch_size} dominios/lote, {workers} workers")
+    if concurrency is not None:
+        print(f"📊 Estrategia: asíncrona, {concurrency} peticiones simultáneas")
+    else:
+        print(f"📊 Estrategia: {batch_size} dominios/lote, {workers} workers")
     print("="*60)
     
-    start_time = time.time()
-    domains = generate_domains_multiple(length, selected_tlds)
-    available = check_domains_parallel(domains, batch_size, workers)
-    total_time = time.time() - start_time
+    # Trabajos asíncronos grandes: un proceso por TLD (hasta un proceso por núcleo)
+    processes = 1
+    if concurrency is not None and total_combinations > SHARD_THRESHOLD:
+        processes = min(os.cpu_count() or 1, len(selected_tlds))
     
-    # Guardar resultados
+    cache_ttl = None if args.no_cache else int(args.cache_ttl * 3600)
+    cache = None
+    if cache_ttl is not None and processes == 1:
+        cache = RDAPCache(ttl_available=cache_ttl, ttl_registered=cache_ttl * 7)
+    
+    # Resultados y checkpoint se escriben durante la búsqueda
     tld_suffix = "_".join([t.replace('.', '') for t in selected_tlds])
     output_file = f"dominios_disponibles_{length}letras_{tld_suffix}.txt"
-    with open(output_file, 'w') as f:
-        for domain in sorted(available):
-            f.write(f"{domain}\n")
+    unknown_file = f"dominios_indeterminados_{length}letras_{tld_suffix}.txt"
+    checkpoint_path = f"checkpoint_{length}letras_{tld_suffix}.txt"
+    checkpoint = Checkpoint(checkpoint_path, 26 * len(selected_tlds))
+    
+    # En modo por procesos cada TLD lleva su propio checkpoint. Se leen
+    # siempre: una ejecución interrumpida pudo usar la otra estrategia.
+    tld_checkpoints = {tld: checkpoint_path.replace(".txt", f"_{tld.lstrip('.')}.txt")
+                       for tld in selected_tlds}
+    done_by_tld = {tld: checkpoint.done | Checkpoint(path, 26).done
+                   for tld, path in tld_checkpoints.items()}
+    done_domains = 26 * sum(len(done) for done in done_by_tld.values())
+    
+    previous = []
+    if done_domains:
+        # Reanudar: conservar lo encontrado en la ejecución interrumpida
+        print(f"♻️  Reanudando: {done_domains:,} dominios ya procesados")
+        if os.path.exists(output_file):
+            with open(output_file) as f:
+                previous = [line.strip() for line in f if line.strip()]
+    else:
+        open(output_file, 'w').close()
+        if os.path.exists(unknown_file):
+            os.remove(unknown_file)
+    pending_total = total_combinations - done_domains
+    
+    start_time = time.time()
+    domains = skip_done(generate_domains_multiple(length, selected_tlds), done_by_tld)
+    try:
+        if processes > 1:
+            available = check_domains_sharded(length, selected_tlds, concurrency, processes,
+                                              pending_total, cache_ttl=cache_ttl,
+                                              dns_prefilter=not args.no_dns,
+                                              output_file=output_file,
+                                              unknown_file=unknown_file,
+                                              checkpoint_paths=tld_checkpoints,
+                                              done_by_tld=done_by_tld)
+        elif concurrency is not None:
+            available = check_domains_async(domains, concurrency, cache=cache,
+                                            total=pending_total,
+                                            dns_prefilter=not args.no_dns,
+                                            output_file=output_file,
+                                            checkpoint=checkpoint,
+                                            unknown_file=unknown_file)
+        else:
+            available = check_domains_parallel(domains, batch_size, workers, cache=cache,
+                                               total=pending_total,
+                                               output_file=output_file,
+                                               checkpoint=checkpoint,
+                                               unknown_file=unknown_file)
+    finally:
+        checkpoint.close()
+        if cache is not None:
+            cache.close()
+    total_time = time.time() - start_time
+    
+    # Guardar resultados ordenados y descartar el checkpoint.
+    # Se ordena una sola vez; el listado final reutiliza este orden.
+    # Un solo join + write en lugar de un f-string y un write por dominio.
+    available = list(set(previous).union(available))
+    available.sort()
+    with open(output_file, 'w', buffering=1 << 20) as f:
+        if available:
+            f.write("\n".join(available))
+            f.write("\n")
+    checkpoint.remove()
+    for path in tld_checkpoints.values():
+        if os.path.exists(path):
+            os.remove(path)
     
     # Resumen final
     print("\n" + "="*60)
@@ -587,12 +2165,12 @@ def main():
     print(f"✅ Tiempo total: {total_time:.1f} segundos")
     print(f"🎯 Dominios disponibles: {len(available)}")
     print(f"📁 Resultados guardados en: {output_file}")
-    print(f"⚡ Velocidad promedio: {len(domains)/total_time:.1f} dominios/segundo")
-    print(f"📈 Eficiencia: {(len(available)/len(domains)*100):.3f}% disponibles")
+    print(f"⚡ Velocidad promedio: {pending_total/total_time:.1f} dominios/segundo")
+    print(f"📈 Eficiencia: {(len(available)/total_combinations*100):.3f}% disponibles")
     
     if available:
         print(f"\n🌟 DOMINIOS ENCONTRADOS ({len(available)}):")
-        for domain in sorted(available):
+        for domain in available:
             print(f"  • {domain}")
     else:
         print(f"\n😢 No se encontraron dominios disponibles para {length} letras en {', '.join(selected_tlds)}")